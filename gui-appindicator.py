@@ -19,10 +19,8 @@ from update import (
     get_sensor_value,
     get_display_backlight_value,
     calc_shifted_backlight_percent,
-    calc_display_temperature,
-    calc_display_rgb,
-    calc_display_gamma_modification,
-    calc_keyboard_backlight_percent,
+    build_policy_table,
+    get_policy_entry,
     modify_display_backlight_value,
     modify_display_gamma_value,
     modify_keyboard_backlight_value
@@ -57,7 +55,7 @@ class Application(Gtk.Application):
         config = configparser.ConfigParser()
         config.readfp(open(config_filepath))
         self.dsp_iface, self.kbd_iface = get_interfaces()
-        self.config = config
+        self.set_config(config)
         self.menu_items = dict()
         self.manage_dsp_backlight = True
         self.manage_dsp_temperature = True
@@ -72,6 +70,11 @@ class Application(Gtk.Application):
     # def show_main_window(self, widget, data=None):
     #     self.window.show_all()
 
+    def set_config(self, config):
+        # The policy table only has to be rebuilt when the config changes.
+        self.config = config
+        self.policy_table = build_policy_table(config)
+
     def icon_quit(self, widget, data=None):
         self.quit()
 
@@ -145,21 +148,17 @@ class Application(Gtk.Application):
         #         # self.last_display_backlight_percent = display_backlight_percent
         #         log('Current display backlight: %d%%' % display_backlight_percent)
 
+        policy = get_policy_entry(config, self.policy_table, display_backlight_percent)
+
         if self.manage_dsp_temperature:
-            display_temperature = calc_display_temperature(config, display_backlight_percent)
+            display_temperature = policy['temperature']
             if self.last_display_temperature != display_temperature:
                 self.last_display_temperature = display_temperature
                 # Modify temperature of display.
                 log('Calculated display temperature: %d' % display_temperature)
-            rgb = calc_display_rgb(config, display_temperature)
-        else:
-            rgb = (1.0, 1.0, 1.0)
-
-        if self.manage_dsp_gamma:
-            # Apply gamma modification.
-            rgb = calc_display_gamma_modification(config, rgb)
 
-        gamma = '%f:%f:%f' % rgb
+        # Temperature and gamma modification are already applied by the table.
+        gamma = policy['gamma'][(self.manage_dsp_temperature, self.manage_dsp_gamma)]
         if self.last_display_gamma_value != gamma:
             self.last_display_gamma_value = gamma
             # Modify gamma value.
@@ -167,7 +166,7 @@ class Application(Gtk.Application):
             modify_display_gamma_value(gamma)
 
         if self.manage_kbd_backlight:
-            keyboard_backlight_percent = calc_keyboard_backlight_percent(display_backlight_percent)
+            keyboard_backlight_percent = policy['keyboard_backlight_percent']
             if self.last_keyboard_backlight_percent != keyboard_backlight_percent:
                 self.last_keyboard_backlight_percent = keyboard_backlight_percent
                 # Modify brightness of keyboard.
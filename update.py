@@ -93,8 +93,9 @@ def calc_display_temperature(config, brightness):
     return temp_min_value + (diff / 100 * brightness)
 
 
-def calc_display_rgb(config, value):
-    temperature_table = get_display_temperature_table(config)
+def calc_display_rgb(config, value, temperature_table=None):
+    if temperature_table is None:
+        temperature_table = get_display_temperature_table(config)
     temperature_data = temperature_table.get(
         value,  # exact match
         temperature_table.get(
@@ -122,6 +123,80 @@ def calc_keyboard_backlight_percent(display_backlight_percent):
     return int(min(100, max(0, 100 - display_backlight_percent)))
 
 
+def calc_display_gamma_value(rgb):
+    return '%f:%f:%f' % rgb
+
+
+def calc_policy_entry(config, display_backlight_percent, temperature_table=None):
+    # Runs the whole chain after the backlight calculation for one percent.
+    # The gamma value is stored per (manage temperature, manage gamma) state.
+    display_temperature = calc_display_temperature(config, display_backlight_percent)
+    rgb = calc_display_rgb(config, display_temperature, temperature_table)
+    gamma = dict()
+    for manage_temperature in (True, False):
+        for manage_gamma in (True, False):
+            gamma_rgb = rgb if manage_temperature else (1.0, 1.0, 1.0)
+            if manage_gamma:
+                gamma_rgb = calc_display_gamma_modification(config, gamma_rgb)
+            gamma[(manage_temperature, manage_gamma)] = calc_display_gamma_value(gamma_rgb)
+    return dict(
+        temperature=display_temperature,
+        rgb=rgb,
+        gamma=gamma,
+        keyboard_backlight_percent=calc_keyboard_backlight_percent(display_backlight_percent),
+    )
+
+
+def build_policy_table(config):
+    # Everything after the backlight calculation only depends on the backlight
+    # percent, so precompute all 101 possible outcomes once per config.
+    temperature_table = get_display_temperature_table(config)
+    return dict(
+        (percent, calc_policy_entry(config, percent, temperature_table))
+        for percent in range(0, 101)
+    )
+
+
+def get_policy_entry(config, policy_table, display_backlight_percent):
+    entry = policy_table.get(display_backlight_percent)
+    if entry is None:
+        # Out of range or fractional percent, fall back to the slow path.
+        entry = calc_policy_entry(config, display_backlight_percent)
+    return entry
+
+
+def check_policy_table(config, policy_table):
+    # Compares the table against the step-by-step functions and returns a
+    # list of mismatches. An empty list means the table is correct.
+    errors = []
+    for percent in range(0, 101):
+        entry = policy_table.get(percent)
+        if entry is None:
+            errors.append('%d%%: missing entry' % percent)
+            continue
+        display_temperature = calc_display_temperature(config, percent)
+        if entry['temperature'] != display_temperature:
+            errors.append('%d%%: temperature %r != %r' % (percent, entry['temperature'], display_temperature))
+        for manage_temperature in (True, False):
+            if manage_temperature:
+                rgb = calc_display_rgb(config, display_temperature)
+                if entry['rgb'] != rgb:
+                    errors.append('%d%%: rgb %r != %r' % (percent, entry['rgb'], rgb))
+            else:
+                rgb = (1.0, 1.0, 1.0)
+            for manage_gamma in (True, False):
+                gamma_rgb = calc_display_gamma_modification(config, rgb) if manage_gamma else rgb
+                gamma = '%f:%f:%f' % gamma_rgb
+                key = (manage_temperature, manage_gamma)
+                if entry['gamma'][key] != gamma:
+                    errors.append('%d%%: gamma%r %r != %r' % (percent, key, entry['gamma'][key], gamma))
+        keyboard_backlight_percent = calc_keyboard_backlight_percent(percent)
+        if entry['keyboard_backlight_percent'] != keyboard_backlight_percent:
+            errors.append('%d%%: keyboard backlight %r != %r' % (
+                percent, entry['keyboard_backlight_percent'], keyboard_backlight_percent))
+    return errors
+
+
 def modify_display_backlight_value(iface, display_backlight_percent):
     iface.SetPercentage(display_backlight_percent)
 
@@ -138,6 +213,14 @@ def main():
     config = configparser.ConfigParser()
     config.readfp(open(sys.argv[1]))
 
+    if '--check-policy-table' in sys.argv or '-c' in sys.argv:
+        # Verify the precomputed policy table against the calculations below.
+        errors = check_policy_table(config, build_policy_table(config))
+        for error in errors:
+            print('Policy table mismatch at %s' % error)
+        print('Policy table check: %s' % ('FAILED' if errors else 'OK'))
+        sys.exit(1 if errors else 0)
+
     display_iface, keyboard_iface = get_interfaces()
 
     if '--display-brightness' in sys.argv or '-b' in sys.argv: